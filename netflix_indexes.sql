@@ -0,0 +1,6 @@
+-- One-time migration for netflix.db (already applied to the committed file).
+-- Re-run with: python -c "import sqlite3; c = sqlite3.connect('netflix.db'); c.executescript(open('netflix_indexes.sql').read())"
+CREATE INDEX IF NOT EXISTS idx_movie_genres_genre ON movie_genres(genre);
+CREATE INDEX IF NOT EXISTS idx_tvshow_genres_genre ON tvshow_genres(genre);
+CREATE INDEX IF NOT EXISTS idx_movies_year_rating ON movies(release_year, rating);
+CREATE INDEX IF NOT EXISTS idx_tvshows_year_rating ON tvshows(release_year, rating);
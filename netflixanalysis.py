@@ -4,9 +4,13 @@
 # ============================================================
 
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import streamlit as st
 import plotly.express as px
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # ------------------------------------------------------------
 # PAGE CONFIG
@@ -27,9 +31,36 @@ Dataset: Netflix Movies & TV Shows
 # ------------------------------------------------------------
 DB_PATH = "netflix.db"
 
-@st.cache_resource
+GENRE_TABLES = {
+    "movies": "movie_genres",
+    "tvshows": "tvshow_genres",
+}
+
+COUNTRY_TABLES = {
+    "movies": "movie_countries",
+    "tvshows": "tvshows_countries",
+}
+
+CONTENT_TYPES = {
+    "movies": "Movies",
+    "tvshows": "TV Shows",
+}
+
+thread_local = threading.local()
+
 def get_connection():
-    return sqlite3.connect(DB_PATH)
+    # One connection per thread: opening the local SQLite file is cheap,
+    # and the preload workers can read side by side. A thread's connection
+    # is closed when the thread finishes. The app only reads; indexes are
+    # added once by netflix_indexes.sql.
+    conn = getattr(thread_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        thread_local.conn = conn
+    return conn
 
 # ------------------------------------------------------------
 # DATA LOADING (CACHED)
@@ -37,15 +68,31 @@ def get_connection():
 @st.cache_data
 def load_movies():
     conn = get_connection()
-    df = pd.read_sql("SELECT * FROM movies", conn)
+    # Skip rows whose release_year is not a number (e.g. stray header rows)
+    # and key the frame by its SQLite rowid
+    df = pd.read_sql("""
+        SELECT rowid, release_year, rating, duration_minutes
+        FROM movies
+        WHERE release_year GLOB '[0-9]*'
+    """, conn, index_col="rowid", dtype={"release_year": "int32", "rating": "category"})
     return df
 
 @st.cache_data
 def load_tvshows():
     conn = get_connection()
-    df = pd.read_sql("SELECT * FROM tvshows", conn)
+    # Skip rows whose release_year is not a number (e.g. stray header rows)
+    # and key the frame by its SQLite rowid
+    df = pd.read_sql("""
+        SELECT rowid, release_year, rating, seasons
+        FROM tvshows
+        WHERE release_year GLOB '[0-9]*'
+    """, conn, index_col="rowid", dtype={"release_year": "int32", "rating": "category"})
     return df
 
+def top_rows(df, limit=10):
+    # Largest last, so horizontal bars read top-down without reversing the axis
+    return df.head(limit).iloc[::-1].reset_index(drop=True)
+
 @st.cache_data
 def load_movie_genres():
     conn = get_connection()
@@ -54,8 +101,8 @@ def load_movie_genres():
         FROM movie_genres
         GROUP BY genre
         ORDER BY total DESC
-    """, conn)
-    return df
+    """, conn, dtype={"genre": "category"})
+    return df, top_rows(df)
 
 @st.cache_data
 def load_tv_genres():
@@ -65,8 +112,8 @@ def load_tv_genres():
         FROM tvshow_genres
         GROUP BY genre
         ORDER BY total DESC
-    """, conn)
-    return df
+    """, conn, dtype={"genre": "category"})
+    return df, top_rows(df)
 
 @st.cache_data
 def load_movie_countries():
@@ -76,8 +123,8 @@ def load_movie_countries():
         FROM movie_countries
         GROUP BY country
         ORDER BY total DESC
-    """, conn)
-    return df
+    """, conn, dtype={"country": "category"})
+    return df, top_rows(df)
 
 @st.cache_data
 def load_tv_countries():
@@ -87,46 +134,199 @@ def load_tv_countries():
         FROM tvshows_countries
         GROUP BY country
         ORDER BY total DESC
-    """, conn)
-    return df
+    """, conn, dtype={"country": "category"})
+    return df, top_rows(df)
+
+LOADERS = (
+    load_movies,
+    load_tvshows,
+    load_movie_genres,
+    load_tv_genres,
+    load_movie_countries,
+    load_tv_countries,
+)
 
-# ------------------------------------------------------------
-# LOAD DATA
-# ------------------------------------------------------------
-movies = load_movies()
-tvshows = load_tvshows()
-movie_genres = load_movie_genres()
-tv_genres = load_tv_genres()
-movie_countries = load_movie_countries()
-tv_countries = load_tv_countries()
+@st.cache_resource
+def preload_data():
+    # Cold start: run the independent loaders side by side so startup
+    # takes about as long as the slowest query instead of their sum
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(
+        max_workers=len(LOADERS),
+        thread_name_prefix="loader",
+        initializer=add_script_run_ctx,
+        initargs=(None, ctx)
+    ) as pool:
+        for future in [pool.submit(loader) for loader in LOADERS]:
+            future.result()
+
+# ------------------------------------------------------------
+# FILTER QUERIES (pushed down to SQLite)
+# ------------------------------------------------------------
+def placeholders(values):
+    return ",".join("?" for _ in values)
+
+def filter_clause(table, content_type, genres, years, ratings):
+    conditions = ["m.release_year BETWEEN ? AND ?"]
+    params = list(years)
+
+    # Genre filter: the genre tables carry no title id, so match the
+    # title's own comma-separated listed_in column
+    if genres:
+        conditions.append("(" + " OR ".join(
+            "',' || m.listed_in || ',' LIKE '%,' || ? || ',%'" for _ in genres
+        ) + ")")
+        params += list(genres)
+
+    # Rating filter
+    if ratings:
+        conditions.append(f"m.rating IN ({placeholders(ratings)})")
+        params += list(ratings)
+
+    # Content type filter: keep the result shape but return no rows
+    if content_type not in ("Both", CONTENT_TYPES[table]):
+        conditions.append("0")
+
+    return f"FROM {table} m WHERE " + " AND ".join(conditions), params
+
+@st.cache_data(max_entries=32)
+def filtered_frame(table, columns, content_type, genres, years, ratings):
+    query, params = filter_clause(table, content_type, genres, years, ratings)
+    return pd.read_sql(
+        f"SELECT m.rowid AS rowid, {columns} {query}",
+        get_connection(),
+        params=params,
+        index_col="rowid"
+    )
+
+@st.cache_data(max_entries=32)
+def count_rows(content_type, genres, years, ratings):
+    # One round trip for both tables, tagged by table name
+    queries = []
+    params = []
+    for table in CONTENT_TYPES:
+        query, table_params = filter_clause(table, content_type, genres, years, ratings)
+        queries.append(f"SELECT '{table}' AS t, COUNT(*) AS total {query}")
+        params += table_params
+
+    return dict(get_connection().execute(" UNION ALL ".join(queries), params).fetchall())
+
+@st.cache_data(max_entries=32)
+def group_counts(table, column, content_type, genres, years, ratings):
+    query, params = filter_clause(table, content_type, genres, years, ratings)
+    return pd.read_sql(f"""
+        SELECT m.{column} AS {column}, COUNT(*) AS total
+        {query}
+        GROUP BY m.{column}
+        ORDER BY m.{column}
+    """, get_connection(), params=params, dtype={"total": "int64"})
+
+@st.cache_data(max_entries=32)
+def top_values(table, column, content_type, genres, years, ratings, limit=10):
+    dim_table = {"genre": GENRE_TABLES, "country": COUNTRY_TABLES}[column][table]
+    source = {"genre": "listed_in", "country": "country"}[column]
+
+    # The genre/country tables carry no title id, so split the title's own
+    # comma-separated column and keep the values those tables know about.
+    # Titles count once per show_id, like the whole-DB aggregates.
+    titles = filtered_frame(
+        table, f"m.show_id, m.{source}", content_type, genres, years, ratings
+    ).drop_duplicates("show_id")
+    labels = pd.read_sql(f"SELECT DISTINCT {column} FROM {dim_table}", get_connection())[column]
+    lookup = dict(zip(labels.str.lower(), labels))
+
+    members = titles[source].str.split(",").explode().str.lower().map(lookup).dropna()
+    df = (
+        members.value_counts()
+        .head(limit)
+        .rename_axis(column)
+        .reset_index(name="total")
+    )
+    return top_rows(df, limit)
 
 # ------------------------------------------------------------
-# DATA CLEANING
+# FILTER MASTER VALUES (CACHED)
 # ------------------------------------------------------------
-movies = movies[movies["release_year"].astype(str).str.isnumeric()]
-tvshows = tvshows[tvshows["release_year"].astype(str).str.isnumeric()]
+@st.cache_data
+def filter_options():
+    movies = load_movies()
+    tvshows = load_tvshows()
+
+    # Inferred categories are already sorted and NaN-free
+    def distinct(*columns):
+        categories = columns[0].cat.categories
+        for col in columns[1:]:
+            categories = categories.union(col.cat.categories)
+        return tuple(categories)
+
+    return {
+        "years": (
+            int(min(movies["release_year"].min(), tvshows["release_year"].min())),
+            int(max(movies["release_year"].max(), tvshows["release_year"].max()))
+        ),
+        "genres": distinct(load_movie_genres()[0]["genre"], load_tv_genres()[0]["genre"]),
+        "countries": distinct(load_movie_countries()[0]["country"], load_tv_countries()[0]["country"]),
+        "ratings": distinct(movies["rating"], tvshows["rating"])
+    }
+
+# ------------------------------------------------------------
+# CHART BUILDERS (CACHED)
+# ------------------------------------------------------------
+# Keyed on the small aggregated frames, so reruns that do not change
+# the data reuse the built figure instead of re-running Plotly Express
+@st.cache_data(max_entries=64)
+def pie_chart(df, names, values, colors):
+    return px.pie(
+        df,
+        names=names,
+        values=values,
+        color_discrete_sequence=colors,
+        hole=0.4
+    )
 
-movies["release_year"] = movies["release_year"].astype(int)
-tvshows["release_year"] = tvshows["release_year"].astype(int)
+@st.cache_data(max_entries=64)
+def line_chart(df, x, y, colors):
+    return px.line(
+        df,
+        x=x,
+        y=y,
+        markers=True,
+        color_discrete_sequence=colors,
+    )
 
-# ------------------------------------------------------------
-# YEAR BOUNDS
-# ------------------------------------------------------------
-min_year = min(movies["release_year"].min(), tvshows["release_year"].min())
-max_year = max(movies["release_year"].max(), tvshows["release_year"].max())
+@st.cache_data(max_entries=64)
+def bar_chart(df, x, y, title, color, horizontal=False):
+    return px.bar(
+        df,
+        x=x,
+        y=y,
+        orientation="h" if horizontal else None,
+        title=title,
+        color_discrete_sequence=[color]
+    )
 
+@st.cache_data(max_entries=64)
+def histogram_chart(df, x, title, color):
+    return px.histogram(
+        df,
+        x=x,
+        nbins=20,
+        title=title,
+        color_discrete_sequence=[color]
+    )
 
-# ============================================================
-# FILTER MASTER VALUES
-# ============================================================
-all_movie_genres = sorted(movie_genres["genre"].dropna().unique())
-all_tv_genres = sorted(tv_genres["genre"].dropna().unique())
+# ------------------------------------------------------------
+# LOAD DATA
+# ------------------------------------------------------------
+preload_data()
 
-all_movie_countries = sorted(movie_countries["country"].dropna().unique())
-all_tv_countries = sorted(tv_countries["country"].dropna().unique())
+movie_genres_top = load_movie_genres()[1]
+tv_genres_top = load_tv_genres()[1]
+movie_countries_top = load_movie_countries()[1]
+tv_countries_top = load_tv_countries()[1]
 
-all_movie_ratings = sorted(movies["rating"].dropna().unique())
-all_tv_ratings = sorted(tvshows["rating"].dropna().unique())
+options = filter_options()
+min_year, max_year = options["years"]
 
 # ------------------------------------------------------------
 # SIDEBAR FILTERS
@@ -148,80 +348,50 @@ content_type = st.sidebar.radio(
 
 genre_filter = st.sidebar.multiselect(
     "Genre",
-    options=sorted(set(all_movie_genres + all_tv_genres)),
+    options=options["genres"],
     default=[]
 )
 
 country_filter = st.sidebar.multiselect(
     "Country",
-    options=sorted(set(all_movie_countries + all_tv_countries)),
+    options=options["countries"],
     default=[]
 )
 
 rating_filter = st.sidebar.multiselect(
     "Rating",
-    options=sorted(set(all_movie_ratings + all_tv_ratings)),
+    options=options["ratings"],
     default=[]
 )
 
 # ------------------------------------------------------------
 # APPLY FILTERS
 # ------------------------------------------------------------
-movies_f = movies[movies["release_year"].between(*year_range)]
-tvshows_f = tvshows[tvshows["release_year"].between(*year_range)]
-
-# Rating filter
-if rating_filter:
-    movies_f = movies_f[movies_f["rating"].isin(rating_filter)]
-    tvshows_f = tvshows_f[tvshows_f["rating"].isin(rating_filter)]
-
-# Content type filter
-if content_type == "Movies":
-    tvshows_f = tvshows_f.iloc[0:0]
-elif content_type == "TV Shows":
-    movies_f = movies_f.iloc[0:0]
-movies_f = movies_f.reset_index(drop=True)
-tvshows_f = tvshows_f.reset_index(drop=True)
-
-# ------------------------------------------------------------
-# GENRE FILTER (via normalized tables)
-# ------------------------------------------------------------
-if genre_filter:
-    conn = sqlite3.connect(DB_PATH)
-
-    movie_ids = pd.read_sql(
-        f"""
-        SELECT DISTINCT rowid
-        FROM movie_genres
-        WHERE genre IN ({','.join('?' for _ in genre_filter)})
-        """,
-        conn,
-        params=genre_filter
-    )["rowid"].tolist()
-
-    tv_ids = pd.read_sql(
-        f"""
-        SELECT DISTINCT rowid
-        FROM tvshow_genres
-        WHERE genre IN ({','.join('?' for _ in genre_filter)})
-        """,
-        conn,
-        params=genre_filter
-    )["rowid"].tolist()
+filters = (
+    content_type,
+    tuple(sorted(genre_filter)),
+    tuple(year_range),
+    tuple(sorted(rating_filter))
+)
 
-    conn.close()
+counts = count_rows(*filters)
+movie_count = counts["movies"]
+tv_count = counts["tvshows"]
 
-    movies_f = (
-        movies_f[movies_f.index.isin(movie_ids)]
-        if movie_ids else movies_f.iloc[0:0]
-    )
+TYPE_COLORS = {"Movies": "#E50914", "TV Shows": "#221F1F"}
 
-    tvshows_f = (
-        tvshows_f[tvshows_f.index.isin(tv_ids)]
-        if tv_ids else tvshows_f.iloc[0:0]
-    )
+NO_TITLES = "No titles match the filters"
+NO_MOVIES = "No movies match the filters"
+NO_TV = "No TV shows match the filters"
 
+# The cached whole-DB aggregates already answer the top-10 charts
+# when no filter narrows the data
+unfiltered = filters == ("Both", (), (min_year, max_year), ())
 
+def top10(table, column, top):
+    if unfiltered:
+        return top
+    return top_values(table, column, *filters)
 
 # ------------------------------------------------------------
 # KPI METRICS
@@ -229,9 +399,9 @@ if genre_filter:
 st.subheader("📌 Key Metrics")
 
 k1, k2, k3 = st.columns(3)
-k1.metric("🎬 Movies", len(movies_f))
-k2.metric("📺 TV Shows", len(tvshows_f))
-k3.metric("🍿 Total Content", len(movies_f) + len(tvshows_f))
+k1.metric("🎬 Movies", movie_count)
+k2.metric("📺 TV Shows", tv_count)
+k3.metric("🍿 Total Content", movie_count + tv_count)
 
 # ------------------------------------------------------------
 # CONTENT MIX PIE CHART
@@ -240,43 +410,49 @@ st.subheader("🍿 Content Mix")
 
 pie_df = pd.DataFrame({
     "Type": ["Movies", "TV Shows"],
-    "Count": [len(movies_f), len(tvshows_f)]
+    "Count": [movie_count, tv_count]
 })
+# Drop empty slices rather than drawing them
+pie_df = pie_df[pie_df["Count"] > 0]
 
-fig_pie = px.pie(
-    pie_df,
-    names="Type",
-    values="Count",
-    color_discrete_sequence=["#E50914", "#221F1F"],
-    hole=0.4
-)
-
-st.plotly_chart(fig_pie, use_container_width=True)
+if len(pie_df):
+    fig_pie = pie_chart(pie_df, "Type", "Count", [TYPE_COLORS[t] for t in pie_df["Type"]])
+    st.plotly_chart(fig_pie, use_container_width=True)
+else:
+    st.info(NO_TITLES)
 
 # ------------------------------------------------------------
 # YEAR-WISE TRENDS
 # ------------------------------------------------------------
 st.subheader("📈 Content Growth Over Time")
 
-movies_year = movies_f.groupby("release_year").size().reset_index(name="Movies")
-tv_year = tvshows_f.groupby("release_year").size().reset_index(name="TV Shows")
-
-trend_df = pd.merge(
-    movies_year,
-    tv_year,
-    on="release_year",
-    how="outer"
-).fillna(0)
-
-fig_trend = px.line(
-    trend_df,
-    x="release_year",
-    y=["Movies", "TV Shows"],
-    markers=True,
-    color_discrete_sequence=["#E50914", "#221F1F"],
-)
+# Only count the sides that have rows; a single side needs no alignment
+year_counts = []
+if movie_count:
+    year_counts.append(group_counts("movies", "release_year", *filters).set_index("release_year")["total"].rename("Movies"))
+if tv_count:
+    year_counts.append(group_counts("tvshows", "release_year", *filters).set_index("release_year")["total"].rename("TV Shows"))
+
+if year_counts:
+    trend_df = (
+        pd.concat(year_counts, axis=1)
+        .fillna(0)
+        .astype("int32")
+        .sort_index()
+        .rename_axis("release_year")
+        .reset_index()
+    )
+    trend_cols = [col.name for col in year_counts]
 
-st.plotly_chart(fig_trend, use_container_width=True)
+    fig_trend = line_chart(
+        trend_df,
+        "release_year",
+        trend_cols,
+        [TYPE_COLORS[col] for col in trend_cols]
+    )
+    st.plotly_chart(fig_trend, use_container_width=True)
+else:
+    st.info(NO_TITLES)
 
 # ------------------------------------------------------------
 # RATING ANALYSIS
@@ -286,24 +462,30 @@ st.subheader("🎯 Rating Distribution")
 r1, r2 = st.columns(2)
 
 with r1:
-    fig_movie_rating = px.bar(
-        movies_f.groupby("rating").size().reset_index(name="total"),
-        x="rating",
-        y="total",
-        title="Movie Ratings",
-        color_discrete_sequence=["#E50914"]
-    )
-    st.plotly_chart(fig_movie_rating, use_container_width=True)
+    if movie_count:
+        fig_movie_rating = bar_chart(
+            group_counts("movies", "rating", *filters),
+            "rating",
+            "total",
+            "Movie Ratings",
+            "#E50914"
+        )
+        st.plotly_chart(fig_movie_rating, use_container_width=True)
+    else:
+        st.info(NO_MOVIES)
 
 with r2:
-    fig_tv_rating = px.bar(
-        tvshows_f.groupby("rating").size().reset_index(name="total"),
-        x="rating",
-        y="total",
-        title="TV Show Ratings",
-        color_discrete_sequence=["#221F1F"]
-    )
-    st.plotly_chart(fig_tv_rating, use_container_width=True)
+    if tv_count:
+        fig_tv_rating = bar_chart(
+            group_counts("tvshows", "rating", *filters),
+            "rating",
+            "total",
+            "TV Show Ratings",
+            "#221F1F"
+        )
+        st.plotly_chart(fig_tv_rating, use_container_width=True)
+    else:
+        st.info(NO_TV)
 
 # ------------------------------------------------------------
 # DURATION & SEASONS ANALYSIS
@@ -313,24 +495,29 @@ st.subheader("⏱ Duration & Seasons Analysis")
 d1, d2 = st.columns(2)
 
 with d1:
-    fig_duration = px.histogram(
-        movies_f,
-        x="duration_minutes",
-        nbins=20,
-        title="Movie Duration Distribution (Minutes)",
-        color_discrete_sequence=["#E50914"]
-    )
-    st.plotly_chart(fig_duration, use_container_width=True)
+    if movie_count:
+        fig_duration = histogram_chart(
+            filtered_frame("movies", "m.duration_minutes", *filters),
+            "duration_minutes",
+            "Movie Duration Distribution (Minutes)",
+            "#E50914"
+        )
+        st.plotly_chart(fig_duration, use_container_width=True)
+    else:
+        st.info(NO_MOVIES)
 
 with d2:
-    fig_seasons = px.bar(
-        tvshows_f.groupby("seasons").size().reset_index(name="total"),
-        x="seasons",
-        y="total",
-        title="TV Shows by Seasons",
-        color_discrete_sequence=["#221F1F"]
-    )
-    st.plotly_chart(fig_seasons, use_container_width=True)
+    if tv_count:
+        fig_seasons = bar_chart(
+            group_counts("tvshows", "seasons", *filters),
+            "seasons",
+            "total",
+            "TV Shows by Seasons",
+            "#221F1F"
+        )
+        st.plotly_chart(fig_seasons, use_container_width=True)
+    else:
+        st.info(NO_TV)
 
 # ------------------------------------------------------------
 # GENRE ANALYSIS
@@ -340,28 +527,32 @@ st.subheader("🎭 Genre Popularity")
 g1, g2 = st.columns(2)
 
 with g1:
-    fig_movie_genre = px.bar(
-        movie_genres.head(10),
-        x="total",
-        y="genre",
-        orientation="h",
-        title="Top Movie Genres",
-        color_discrete_sequence=["#B20710"]
-    )
-    fig_movie_genre.update_layout(yaxis=dict(autorange="reversed"))
-    st.plotly_chart(fig_movie_genre, use_container_width=True)
+    if movie_count:
+        fig_movie_genre = bar_chart(
+            top10("movies", "genre", movie_genres_top),
+            "total",
+            "genre",
+            "Top Movie Genres",
+            "#B20710",
+            horizontal=True
+        )
+        st.plotly_chart(fig_movie_genre, use_container_width=True)
+    else:
+        st.info(NO_MOVIES)
 
 with g2:
-    fig_tv_genre = px.bar(
-        tv_genres.head(10),
-        x="total",
-        y="genre",
-        orientation="h",
-        title="Top TV Genres",
-        color_discrete_sequence=["#141414"]
-    )
-    fig_tv_genre.update_layout(yaxis=dict(autorange="reversed"))
-    st.plotly_chart(fig_tv_genre, use_container_width=True)
+    if tv_count:
+        fig_tv_genre = bar_chart(
+            top10("tvshows", "genre", tv_genres_top),
+            "total",
+            "genre",
+            "Top TV Genres",
+            "#141414",
+            horizontal=True
+        )
+        st.plotly_chart(fig_tv_genre, use_container_width=True)
+    else:
+        st.info(NO_TV)
 
 # ------------------------------------------------------------
 # COUNTRY ANALYSIS
@@ -371,28 +562,32 @@ st.subheader("🌍 Country-wise Content")
 c1, c2 = st.columns(2)
 
 with c1:
-    fig_movie_country = px.bar(
-        movie_countries.head(10),
-        x="total",
-        y="country",
-        orientation="h",
-        title="Top Movie Producing Countries",
-        color_discrete_sequence=["#E50914"]
-    )
-    fig_movie_country.update_layout(yaxis=dict(autorange="reversed"))
-    st.plotly_chart(fig_movie_country, use_container_width=True)
+    if movie_count:
+        fig_movie_country = bar_chart(
+            top10("movies", "country", movie_countries_top),
+            "total",
+            "country",
+            "Top Movie Producing Countries",
+            "#E50914",
+            horizontal=True
+        )
+        st.plotly_chart(fig_movie_country, use_container_width=True)
+    else:
+        st.info(NO_MOVIES)
 
 with c2:
-    fig_tv_country = px.bar(
-        tv_countries.head(10),
-        x="total",
-        y="country",
-        orientation="h",
-        title="Top TV Producing Countries",
-        color_discrete_sequence=["#221F1F"]
-    )
-    fig_tv_country.update_layout(yaxis=dict(autorange="reversed"))
-    st.plotly_chart(fig_tv_country, use_container_width=True)
+    if tv_count:
+        fig_tv_country = bar_chart(
+            top10("tvshows", "country", tv_countries_top),
+            "total",
+            "country",
+            "Top TV Producing Countries",
+            "#221F1F",
+            horizontal=True
+        )
+        st.plotly_chart(fig_tv_country, use_container_width=True)
+    else:
+        st.info(NO_TV)
 
 # ------------------------------------------------------------
 # FOOTER